@@ -3,55 +3,64 @@
 # Recon Automation Drone
 # This script automates the reconnaissance process using nmap and feroxbuster.
 # It creates a tmux session with separate panes for each tool and runs them in parallel.
-import subprocess
 import argparse
 import logging
 import ipaddress
-import time
 import os
+import shutil
+import shlex
 import re
+import xml.etree.ElementTree as ET
 from libtmux import Server
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def find_web_ports(nmap_output_file):
-    """Parse nmap output to find web server ports"""
-    web_ports = []
-    if not os.path.exists(nmap_output_file):
-        return web_ports
+# Cheap check that the target is an IPv4, IPv6 or domain-shaped string
+# Each hostname label must start and end with an alphanumeric character, so
+# targets such as "-sL" can't be mistaken for nmap options
+_TARGET_RE = re.compile(
+    r'[\da-fA-F:]+'
+    r'|[A-Za-z0-9](?:[A-Za-z0-9_-]*[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9_-]*[A-Za-z0-9])?)*'
+)
+# Targets made only of digits and dots must be a valid IPv4 address
+_NUMERIC_TARGET_RE = re.compile(r'[\d.]+')
+
+def find_web_ports(nmap_xml_file):
+    """Parse nmap XML output to find web server ports"""
+    # Ordered dict used as a set so duplicate ports are dropped in O(1)
+    seen = {}
+    if not os.path.exists(nmap_xml_file):
+        return []
     
     try:
-        with open(nmap_output_file, 'r') as f:
-            content = f.read()
-            
-        # Check if scan is still running
-        if "Nmap done:" not in content:
-            return None  # Scan still in progress
-            
-        # Look for web servers
-        # Pattern matches port numbers followed by "http" services
-        port_pattern = r'(\d+)\/tcp\s+open\s+(http|https|ssl\/http|http-alt|https-alt)'
-        http_matches = re.finditer(port_pattern, content, re.IGNORECASE)
-        
-        for match in http_matches:
-            port = match.group(1)
-            service = match.group(2)
-            web_ports.append(port)
+        with open(nmap_xml_file, 'rb') as f:
+            # Check if scan is still running. The closing tag is the last thing
+            # nmap writes, so only the tail of the file needs to be read.
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, size - 64))
+            if b"</nmaprun>" not in f.read():
+                return None  # Scan still in progress
             
-        # Also check for ports where the service name contains "http"
-        service_pattern = r'(\d+)\/tcp\s+open\s+\w+\s+.*http'
-        service_matches = re.finditer(service_pattern, content, re.IGNORECASE)
-        
-        for match in service_matches:
-            port = match.group(1)
-            if port not in web_ports:
-                web_ports.append(port)
+            # Look for open ports running a web service, streaming the document
+            # and clearing each port element once it has been checked
+            f.seek(0)
+            for _, element in ET.iterparse(f, events=("end",)):
+                if element.tag != "port":
+                    continue
+                state = element.find("state")
+                service = element.find("service")
+                if (
+                    state is not None and state.get("state") == "open"
+                    and service is not None and service.get("name", "").startswith("http")
+                ):
+                    seen[element.get("portid")] = None
+                element.clear()
                 
     except Exception as e:
         logging.error(f"Error parsing nmap output: {e}")
         
-    return web_ports
+    return list(seen)
 
 def main():
     parser = argparse.ArgumentParser(description="Automate reconnaissance process.")
@@ -59,63 +68,87 @@ def main():
     args = parser.parse_args()
 
     target_ip = args.target
-    nmap_output_file = f"nmap_{target_ip}.txt"
+    # nmap writes nmap_<target>.nmap, .xml and .gnmap from this base name
+    nmap_output_base = f"nmap_{target_ip}"
+    nmap_xml_file = f"{nmap_output_base}.xml"
 
     # Validate the target IP address or domain
-    try:
-        ipaddress.ip_address(target_ip)
-    except ValueError:
+    if not _TARGET_RE.fullmatch(target_ip):
         logging.error("Invalid IP address or domain")
         return
+    # Only build an address object for targets that look like an IP
+    if ":" in target_ip or _NUMERIC_TARGET_RE.fullmatch(target_ip):
+        try:
+            ipaddress.ip_address(target_ip)
+        except ValueError:
+            logging.error("Invalid IP address or domain")
+            return
 
     # Check if nmap, feroxbuster, and tmux are installed
     dependencies = ["nmap", "feroxbuster", "tmux"]
     for dependency in dependencies:
-        try:
-            subprocess.run([dependency, "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        except FileNotFoundError:
+        if shutil.which(dependency) is None:
             logging.error(f"{dependency} is not installed")
             return
 
+    # Remove XML output left over from an earlier scan of this target, so the
+    # watcher doesn't take its results before the new nmap run replaces it
+    try:
+        os.remove(nmap_xml_file)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logging.error(f"Could not remove old nmap output {nmap_xml_file}: {e}")
+        return
+
     # Create a new tmux session
     try:
         server = Server()
         
-        # Kill existing session if it exists
+        # Kill existing session if it exists, listing sessions once and
+        # looking them up by name
         try:
-            existing_session = server.find_where({"session_name": "Drone"})
+            sessions = {s.name: s for s in server.sessions}
+            existing_session = sessions.pop("Drone", None)
             if existing_session:
                 existing_session.kill_session()
         except:
             pass
         
-        # Create new session with attach=False
-        session = server.new_session(session_name="Drone", attach=False, window_name="Recon")
-        logging.info("New tmux session created")
-        
-        # Give tmux a moment to initialize
-        time.sleep(0.5)
+        # Quote everything that ends up on a pane's command line once, up front
+        tgt = shlex.quote(target_ip)
+        out = shlex.quote(nmap_output_base)
+        xml = shlex.quote(nmap_xml_file)
         
-        # Get the initial window and pane for nmap
-        window = session.attached_window
-        nmap_pane = window.attached_pane
-        nmap_pane.send_keys("clear")
-        nmap_pane.send_keys(f"echo 'NMAP SCAN' && nmap -sC -sV -oN {nmap_output_file} {target_ip} -v -T4 --min-rate 1000")
+        # Each pane gets a single command line so only one send-keys is issued per pane
+        nmap_cmd = f"clear; echo 'NMAP SCAN' && nmap -sC -sV -oA {out} {tgt} -v -T4 --min-rate 1000"
         
-        # Create a new pane for monitoring web servers
-        ferox_pane = window.split_window(vertical=False)
-        ferox_pane.send_keys("clear")
-        ferox_pane.send_keys(f"echo 'Waiting for NMAP to discover web servers...'")
+        # Start the watcher that runs feroxbuster once nmap has finished
+        ferox_cmd = (
+            f"clear; echo 'Waiting for NMAP to discover web servers...'; "
+            f"python3 ./wait_and_ferox.py -t {tgt} -f {xml}"
+        )
         
-        # Set the layout to tiled for equal pane sizes
-        window.select_layout("tiled")
-        
-        # Start the wait_and_scan script with proper environment variables
-        ferox_pane.send_keys(f"export NMAP_OUTPUT_FILE='{nmap_output_file}'; export TARGET_IP='{target_ip}'; bash ./feroxscript.sh")
+        # Create the session, start nmap in its first pane, split off a pane for
+        # monitoring web servers and tile the layout, all in one tmux call.
+        # send-keys targets the window's active pane, which split-window moves
+        # to the new pane.
+        result = server.cmd(
+            "new-session", "-d", "-s", "Drone", "-n", "Recon", ";",
+            "send-keys", "-t", "Drone:Recon", nmap_cmd, "Enter", ";",
+            "split-window", "-h", "-t", "Drone:Recon", ";",
+            "send-keys", "-t", "Drone:Recon", ferox_cmd, "Enter", ";",
+            "select-layout", "-t", "Drone:Recon", "tiled",
+        )
+        if result.stderr:
+            raise RuntimeError(" ".join(result.stderr))
+        # tmux runs the whole sequence before returning, so the session is ready now
+        logging.info("New tmux session created")
         
         # Attach to the tmux session
         logging.info("Attaching to tmux session...")
-        os.system("tmux attach -t Drone")
+        # Replace this process with tmux rather than forking a shell to run it
+        os.execvp("tmux", ["tmux", "attach", "-t", "Drone"])
         
     except Exception as e:
         logging.error(f"Error running reconnaissance process: {e}")
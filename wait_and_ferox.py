@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Recon Automation Drone - feroxbuster launcher
+# This script runs in the second tmux pane. It waits for nmap to finish writing its
+# XML output, then runs feroxbuster against every web server port nmap found.
+import subprocess
+import argparse
+import logging
+import shlex
+import time
+import os
+from drone import find_web_ports
+
+# Set up logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+# inotify_simple is optional, without it we fall back to watching the file's mtime
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+def wait_for_web_ports(nmap_xml_file):
+    """Block until nmap has finished writing its XML output and return the web server ports"""
+    directory = os.path.dirname(os.path.abspath(nmap_xml_file))
+    name = os.path.basename(nmap_xml_file)
+
+    inotify = None
+    if INotify is not None:
+        inotify = INotify()
+        inotify.add_watch(directory, flags.CLOSE_WRITE | flags.MOVED_TO)
+
+    last_mtime = None
+    try:
+        while True:
+            # Only parse the file when it exists, find_web_ports returns None until nmap is done
+            if os.path.exists(nmap_xml_file):
+                web_ports = find_web_ports(nmap_xml_file)
+                if web_ports is not None:
+                    return web_ports
+
+            if inotify is not None:
+                # Wake up when nmap closes the output file. An empty read means the
+                # timeout expired, so re-check the file in case we missed the event.
+                while True:
+                    events = inotify.read(timeout=10000)
+                    if not events or any(event.name == name for event in events):
+                        break
+            else:
+                # Sleep until the file's mtime changes
+                while True:
+                    time.sleep(1)
+                    try:
+                        mtime = os.stat(nmap_xml_file).st_mtime
+                    except FileNotFoundError:
+                        continue
+                    if mtime != last_mtime:
+                        last_mtime = mtime
+                        break
+    finally:
+        if inotify is not None:
+            inotify.close()
+
+def ferox_cmd(target_ip, port):
+    """Build the feroxbuster argv for one web server port"""
+    return [
+        "feroxbuster", "-u", f"http://{target_ip}:{port}",
+        "-x", "txt,html,php", "-o", f"feroxbuster_{target_ip}_{port}.txt",
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Run feroxbuster once nmap finds web servers.")
+    parser.add_argument("-t", "--target", help="Target IP address or domain", required=True)
+    parser.add_argument("-f", "--file", help="nmap XML output file to watch", required=True)
+    args = parser.parse_args()
+
+    target_ip = args.target
+    logging.info(f"Waiting for nmap to finish writing {args.file}...")
+    web_ports = wait_for_web_ports(args.file)
+
+    if not web_ports:
+        logging.info("Scan complete. No web servers to scan.")
+        return
+    logging.info(f"Scan complete. Found web servers on ports: {', '.join(web_ports)}")
+
+    first_port, other_ports = web_ports[0], web_ports[1:]
+
+    # Inside tmux, scan every other port concurrently in its own pane. The panes
+    # are all created with a single tmux call and the layout retiled as we go.
+    if os.environ.get("TMUX") and other_ports:
+        target_pane = ["-t", os.environ["TMUX_PANE"]] if os.environ.get("TMUX_PANE") else []
+        tmux_args = ["tmux"]
+        for port in other_ports:
+            pane_cmd = f"{shlex.join(ferox_cmd(target_ip, port))}; exec bash"
+            # -P prints one line per pane created, so we can tell how far tmux got
+            tmux_args += ["split-window", "-d", "-P", *target_pane, pane_cmd, ";"]
+            tmux_args += ["select-layout", *target_pane, "tiled", ";"]
+        result = subprocess.run(tmux_args[:-1], capture_output=True, text=True)
+
+        # tmux stops at the first failing command (e.g. "no space for new pane"),
+        # so any ports after that are scanned serially in this pane instead
+        started = len(result.stdout.splitlines())
+        for port in other_ports[:started]:
+            logging.info(f"Started feroxbuster scan on port {port} in a new pane")
+        if result.returncode != 0:
+            logging.warning(
+                f"Could only open {started} of {len(other_ports)} panes: {result.stderr.strip()}"
+            )
+        other_ports = other_ports[started:]
+
+    for port in [first_port] + other_ports:
+        logging.info(f"Starting feroxbuster scan on port {port}")
+        subprocess.run(ferox_cmd(target_ip, port))
+
+if __name__ == "__main__":
+    main()